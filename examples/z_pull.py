@@ -12,8 +12,9 @@
 #   ZettaScale Zenoh Team, <zenoh@zettascale.tech>
 #
 
+import os
 import sys
-import time
+import asyncio
 from datetime import datetime
 import argparse
 import json
@@ -65,6 +66,35 @@ def listen(sample):
     print(f">> [Subscriber] Received {sample.kind} ('{sample.key_expr}': '{sample.payload.decode('utf-8')}')")
 
 
+def pull_on_enter(sub):
+    for line in sys.stdin:
+        if line.strip() == 'q':
+            break
+        sub.pull()
+
+
+async def pull_on_input(sub):
+    # Let the event loop wake us up when stdin is readable rather than blocking on it.
+    loop = asyncio.get_running_loop()
+    done = asyncio.Event()
+    fd = sys.stdin.fileno()
+
+    def on_input():
+        # Read the raw fd: lines left in `sys.stdin`'s buffer wouldn't wake us up again.
+        lines = os.read(fd, 4096).splitlines()
+        if not lines:
+            done.set()
+        for line in lines:
+            if line.strip() == b'q':
+                done.set()
+                break
+            sub.pull()
+
+    loop.add_reader(fd, on_input)
+    await done.wait()
+    loop.remove_reader(fd)
+
+
 def main():
     # initiate logging
     zenoh.init_logger()
@@ -76,14 +106,12 @@ def main():
 
     sub = session.declare_pull_subscriber(key, listen, reliability=Reliability.RELIABLE())
 
-    print("Press <enter> to pull data...")
-    c = '\0'
-    while c != 'q':
-        c = sys.stdin.read(1)
-        if c == '':
-            time.sleep(1)
-        else:
-            sub.pull()
+    print("Press <enter> to pull data, or enter 'q' to quit...")
+    try:
+        asyncio.run(pull_on_input(sub))
+    except (NotImplementedError, PermissionError):
+        # The event loop can't watch this stdin (e.g. on Windows, or if it's a regular file), so block on it instead.
+        pull_on_enter(sub)
 
     sub.undeclare()
     session.close()
@@ -103,48 +103,94 @@ where
     }
 }
 
+fn timeout_duration(secs: f32) -> PyResult<std::time::Duration> {
+    std::time::Duration::try_from_secs_f32(secs).map_err(|e| {
+        pyo3::exceptions::PyValueError::new_err(format!("Invalid timeout {}: {}", secs, e))
+    })
+}
+
 #[pyclass(subclass)]
 pub struct _Queue {
     send: Mutex<Option<flume::Sender<PyObject>>>,
     recv: flume::Receiver<PyObject>,
+    drop_oldest: bool,
 }
 #[pymethods]
 impl _Queue {
     #[new]
-    pub fn pynew(bound: Option<usize>) -> Self {
-        let (send, recv) = match bound {
-            None => flume::unbounded(),
-            Some(bound) => flume::bounded(bound),
+    pub fn pynew(bound: Option<usize>, maxlen: Option<usize>) -> PyResult<Self> {
+        let (send, recv) = match (bound, maxlen) {
+            (Some(_), Some(_)) => {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    "`bound` and `maxlen` are mutually exclusive",
+                ))
+            }
+            (_, Some(0)) => {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    "`maxlen` must be at least 1",
+                ))
+            }
+            (None, None) => flume::unbounded(),
+            (Some(bound), None) | (None, Some(bound)) => flume::bounded(bound),
         };
-        Self {
+        Ok(Self {
             send: Mutex::new(Some(send)),
             recv,
-        }
+            drop_oldest: maxlen.is_some(),
+        })
     }
     pub fn close(&self) {
         *self.send.lock().unwrap() = None;
     }
     pub fn put(&self, value: PyObject, py: Python<'_>) -> PyResult<()> {
-        Python::allow_threads(py, || match self.send.lock().unwrap().as_ref() {
-            None => Err(pyo3::exceptions::PyBrokenPipeError::new_err(
-                "Attempted to put on closed Queue",
-            )),
-            Some(send) => {
-                send.send(value).unwrap();
+        let guard = self.send.lock().unwrap();
+        let send = match guard.as_ref() {
+            None => {
+                return Err(pyo3::exceptions::PyBrokenPipeError::new_err(
+                    "Attempted to put on closed Queue",
+                ))
+            }
+            Some(send) => send,
+        };
+        // Only release the GIL if the queue is full and we actually have to block:
+        // the common case of a non-full queue is then a single non-blocking push.
+        match send.try_send(value) {
+            Ok(()) => Ok(()),
+            Err(flume::TrySendError::Full(mut value)) if self.drop_oldest => {
+                let mut evicted = Vec::new();
+                loop {
+                    // Evict the oldest element; a concurrent `get` may also have made room.
+                    evicted.extend(self.recv.try_recv().ok());
+                    match send.try_send(value) {
+                        Ok(()) => break,
+                        Err(flume::TrySendError::Full(v)) => value = v,
+                        Err(flume::TrySendError::Disconnected(_)) => unreachable!(),
+                    }
+                }
+                // Dropping the evicted values may run arbitrary Python code (`__del__`),
+                // which must not happen while `self.send` is locked.
+                drop(guard);
+                drop(evicted);
                 Ok(())
             }
-        })
+            Err(flume::TrySendError::Full(value)) => {
+                let send = send.clone();
+                drop(guard);
+                Python::allow_threads(py, || send.send(value).unwrap());
+                Ok(())
+            }
+            // `self.recv` keeps the channel connected for as long as `self` lives.
+            Err(flume::TrySendError::Disconnected(_)) => unreachable!(),
+        }
     }
     pub fn get(&self, timeout: Option<f32>, py: Python<'_>) -> PyResult<PyObject> {
+        let timeout = timeout.map(timeout_duration).transpose()?;
         Python::allow_threads(py, || match timeout {
             None => match self.recv.recv() {
                 Ok(value) => Ok(value),
                 Err(_) => Err(pyo3::exceptions::PyStopIteration::new_err(())),
             },
-            Some(secs) => match self
-                .recv
-                .recv_timeout(std::time::Duration::from_secs_f32(secs))
-            {
+            Some(timeout) => match self.recv.recv_timeout(timeout) {
                 Ok(value) => Ok(value),
                 Err(flume::RecvTimeoutError::Timeout) => {
                     Err(pyo3::exceptions::PyTimeoutError::new_err(()))
@@ -156,12 +202,23 @@ impl _Queue {
         })
     }
     pub fn get_remaining(&self, timeout: Option<f32>, py: Python<'_>) -> PyResult<Py<PyList>> {
+        let deadline = match timeout {
+            None => None,
+            Some(secs) => Some(
+                std::time::Instant::now()
+                    .checked_add(timeout_duration(secs)?)
+                    .ok_or_else(|| {
+                        pyo3::exceptions::PyValueError::new_err(format!(
+                            "Invalid timeout {}: too large",
+                            secs
+                        ))
+                    })?,
+            ),
+        };
         Python::allow_threads(py, || {
-            let vec = match timeout {
+            let vec = match deadline {
                 None => self.recv.iter().collect::<Vec<_>>(),
-                Some(secs) => {
-                    let deadline =
-                        std::time::Instant::now() + std::time::Duration::from_secs_f32(secs);
+                Some(deadline) => {
                     let mut vec = Vec::new();
                     loop {
                         match self.recv.recv_deadline(deadline) {
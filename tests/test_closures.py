@@ -0,0 +1,84 @@
+import zenoh
+import pytest
+import weakref
+from threading import Thread
+
+
+def test_queue_get_remaining_timeout():
+    queue = zenoh.Queue()
+    queue.put(1)
+    queue.put(2)
+    with pytest.raises(TimeoutError) as error:
+        queue.get_remaining(0.05)
+    assert error.value.args[0] == [1, 2]
+
+
+@pytest.mark.parametrize("timeout", [-1.0, float("nan")])
+def test_queue_invalid_timeout(timeout: float):
+    queue = zenoh.Queue()
+    with pytest.raises(ValueError):
+        queue.get(timeout)
+    with pytest.raises(ValueError):
+        queue.get_remaining(timeout)
+
+
+def test_closure_relay_applies_type_adaptor():
+    received = []
+    closure = zenoh.Closure(received.append, type_adaptor=lambda x: x * 2, prevent_direct_calls=True)
+    closure.call(1)
+    closure.call(2)
+    closure.drop()
+    assert received == [2, 4]
+
+
+def test_closure_subclass_may_override_call():
+    class Doubling(zenoh.Closure):
+        @property
+        def call(self):
+            inner = self._call_
+            return lambda x: inner(x * 2)
+
+    received = []
+    closure = Doubling(received.append)
+    closure.call(1)
+    assert received == [2]
+
+
+def test_closure_subclass_may_override_call_as_method():
+    class Tagging(zenoh.Closure):
+        def call(self, x):
+            return ("override", x)
+
+    assert Tagging(lambda x: ("base", x)).call(1) == ("override", 1)
+
+
+def test_handlers_support_weakrefs():
+    closure = zenoh.Closure(lambda x: None)
+    for value in (closure, zenoh.Handler(closure), zenoh.ListCollector(), zenoh.Queue()):
+        assert weakref.ref(value)() is value
+
+
+def test_queue_maxlen_evicts_oldest():
+    queue = zenoh.Queue(maxlen=3)
+    for i in range(5):
+        queue.put(i)
+    assert queue.get() == 2
+    queue.put(5)
+    queue.close()
+    assert queue.get_remaining() == [3, 4, 5]
+
+
+def test_queue_maxlen_put_never_blocks():
+    queue = zenoh.Queue(maxlen=1)
+    putter = Thread(target=lambda: [queue.put(i) for i in range(1_000)])
+    putter.start()
+    putter.join(timeout=5)
+    assert not putter.is_alive()
+    queue.close()
+    assert queue.get_remaining() == [999]
+
+
+@pytest.mark.parametrize("kwargs", [{"bound": 1, "maxlen": 1}, {"maxlen": 0}])
+def test_queue_maxlen_invalid(kwargs):
+    with pytest.raises(ValueError):
+        zenoh.Queue(**kwargs)
@@ -11,9 +11,8 @@
 # Contributors:
 #   ZettaScale Zenoh Team, <zenoh@zettascale.tech>
 #
-import abc
 from typing import Generic, Callable, Union, Any, TypeVar, Tuple, List
-from threading import Condition, Thread
+from threading import Event, Thread
 from collections import deque
 import time
 
@@ -29,21 +28,14 @@ class IClosure(Generic[In, Out]):
     """
     A Closure is a pair of a ``call`` function that will be used as a callback,
     and a ``drop`` function that will be called when the closure is destroyed.
+
+    Implementations may provide ``call`` and ``drop`` either as plain attributes or as properties.
     """
-    @property
-    @abc.abstractmethod
-    def call(self) -> Callable[[In], Out]:
-        """
-        Returns the closure's call function as a lambda.
-        """
-        ...
-    @property
-    @abc.abstractmethod
-    def drop(self) -> Callable[[], None]:
-        """
-        Returns the closure's destructor as a lambda.
-        """
-        ...
+    __slots__ = ()
+    call: Callable[[In], Out]
+    "The closure's call function."
+    drop: Callable[[], None]
+    "The closure's destructor."
     def __enter__(self):
         drop = self.drop
         if drop is not None:
@@ -56,19 +48,23 @@ class IClosure(Generic[In, Out]):
 class IHandler(Generic[In, Out, Receiver]):
     """
     A Handler is a value that may be converted into a callback closure for zenoh to use on one side, while possibly providing a receiver for the data that zenoh would provide through that callback.
+
+    Implementations may provide ``closure`` and ``receiver`` either as plain attributes or as properties.
     """
-    @property
-    @abc.abstractmethod
-    def closure(self) -> IClosure[In, Out]:
-        """
-        The part of the handler that should be passed as a callback to a zenoh function.
-        """
-        ...
-    @property
-    @abc.abstractmethod
-    def receiver(self) -> Receiver:
-        "The part of the handler that should be used as the receiver when the handler is channel-like."
-        ...
+    __slots__ = ()
+    closure: IClosure[In, Out]
+    "The part of the handler that should be passed as a callback to a zenoh function."
+    receiver: Receiver
+    "The part of the handler that should be used as the receiver when the handler is channel-like."
+
+def _set_unless_overridden(obj, base: type, name: str, value):
+    "Sets ``obj.<name>`` to ``value``, unless a subclass of ``base`` overrides ``name`` (as a method, property or class attribute)."
+    for cls in type(obj).__mro__:
+        if cls is base:
+            break
+        if name in vars(cls):
+            return
+    setattr(obj, name, value)
 
 IntoClosure = Union[IHandler[In, Out, Any], IClosure[In, Out], Tuple[CallbackCall, CallbackDrop], CallbackCall]
 class Closure(IClosure, Generic[In, Out]):
@@ -76,6 +72,7 @@ class Closure(IClosure, Generic[In, Out]):
     A Closure is a pair of a ``call`` function that will be used as a callback,
     and a ``drop`` function that will be called when the closure is destroyed.
     """
+    __slots__ = ('_call_', '_drop_', 'call', 'drop', '__weakref__')
     def __init__(self, closure: IntoClosure[In, Out], type_adaptor: Callable[[Any], In] = None, prevent_direct_calls=False):
         _call_ = None
         _drop_ = lambda: None
@@ -92,18 +89,20 @@ class Closure(IClosure, Generic[In, Out]):
         else:
             raise TypeError("Unexpected type as input for zenoh.Closure")
         if type_adaptor is not None:
-            adapted = lambda *args: _call_(type_adaptor(*args))
+            # dev-note: binding through keyword-only defaults keeps lookups local on this per-sample path.
+            def adapted(arg, *, _call_=_call_, _adapt_=type_adaptor):
+                return _call_(_adapt_(arg))
         else:
             adapted = _call_
         if prevent_direct_calls:
             queue = Queue(128)
             def readqueue():
                 for x in queue:
-                    adapted(*x)
+                    adapted(x)
                     x = None
             t = Thread(target=readqueue)
             t.start()
-            self._call_ = lambda *args: queue.put(args)
+            self._call_ = queue.put
             def drop():
                 queue.close()
                 t.join()
@@ -112,14 +111,11 @@ class Closure(IClosure, Generic[In, Out]):
         else:
             self._call_ = _call_
             self._drop_ = _drop_
-
-    @property
-    def call(self) -> Callable[[In], Out]:
-        return self._call_
-
-    @property
-    def drop(self) -> Callable[[], None]:
-        return self._drop_
+        # dev-note: `call` and `drop` are plain attributes since they never change after construction.
+        # `_call_` and `_drop_` hold the same values so that subclasses overriding `call`/`drop`
+        # (e.g. as properties, as they were originally defined) keep working and can still reach them.
+        _set_unless_overridden(self, Closure, 'call', self._call_)
+        _set_unless_overridden(self, Closure, 'drop', self._drop_)
 
 IntoHandler = Union[IHandler[In, Out, Receiver], IClosure[In, Out],  Tuple[IClosure, Receiver], Tuple[CallbackCall,CallbackDrop, Receiver], Tuple[CallbackCall,CallbackDrop], CallbackCall]
 class Handler(IHandler, Generic[In, Out, Receiver]):
@@ -130,6 +126,7 @@ class Handler(IHandler, Generic[In, Out, Receiver]):
         a) ``input`` is already an instance of ``Closure`` or ``Handler`` where ``input.closure`` is an instance of ``Closure``
         b) ``prevent_direct_calls`` is set to ``False``
     """
+    __slots__ = ('_closure_', '_receiver_', 'closure', 'receiver', '__weakref__')
     def __init__(self, input: IntoHandler[In, Out, Receiver], type_adaptor: Callable[[Any], In] = None, prevent_direct_calls = True):
         self._receiver_ = None
         if isinstance(input, IHandler):
@@ -148,13 +145,8 @@ class Handler(IHandler, Generic[In, Out, Receiver]):
         else:
             self._closure_ = input
         self._closure_ = Closure(self._closure_, type_adaptor, prevent_direct_calls and not isinstance(self._closure_, Closure))
-
-    @property
-    def closure(self) -> IClosure[In, Out]:
-        return self._closure_
-    @property
-    def receiver(self) -> Receiver:
-        return self._receiver_
+        _set_unless_overridden(self, Handler, 'closure', self._closure_)
+        _set_unless_overridden(self, Handler, 'receiver', self._receiver_)
 
 
 
@@ -165,29 +157,24 @@ class ListCollector(IHandler[In, None, Callable[[],List[In]]], Generic[In]):
     When used as a handler, it provides a callback that appends elements to a list,
     and provides a function that will await the closing of the callback before returning said list.
     """
+    __slots__ = ('_vec_', '_done_event_', '_closure_cache_', 'timeout', '__weakref__')
     def __init__(self, timeout=None):
         self._vec_ = []
-        self._cv_ = Condition()
-        self._done_ = False
+        self._done_event_ = Event()
+        self._closure_cache_ = None
         self.timeout = timeout
     
     @property
     def closure(self):
-        def call(x):
-            self._vec_.append(x)
-        def drop():
-            with self._cv_:
-                self._done_ = True
-                self._cv_.notify()
-        return Closure((call, drop))
+        if self._closure_cache_ is None:
+            self._closure_cache_ = Closure((self._vec_.append, self._done_event_.set))
+        return self._closure_cache_
     
     @property
     def receiver(self):
         def wait():
-            with self._cv_:
-                if not self._done_:
-                    self._cv_.wait(timeout=self.timeout)
-                return self._vec_
+            self._done_event_.wait(self.timeout)
+            return self._vec_
         return wait
 
 class Queue(IHandler[In, None, 'Queue'], Generic[In]):
@@ -195,18 +182,23 @@ class Queue(IHandler[In, None, 'Queue'], Generic[In]):
     A binding for a Rust multi-producer, single-consumer queue implementation.
 
     When used as a handler, it provides itself as the receiver, and will provide a
-    callback that appends elements to the queue.
+    callback that appends elements to the queue. Elements are received in the order they were put (FIFO).
 
-    Can be bounded by passing a maximum size as ``bound``.
+    Can be bounded by passing a maximum size as ``bound``, in which case ``put`` blocks while the queue is full.
+    Alternatively, passing a maximum size as ``maxlen`` makes the queue lossy: ``put`` never blocks, and
+    discards the oldest queued element instead when the queue is full. ``bound`` and ``maxlen`` are mutually exclusive.
     """
-    def __init__(self, bound: int = None):
-        self._inner_ = _Queue(bound)
+    __slots__ = ('_inner_', '_closure_cache_', '__weakref__')
+    def __init__(self, bound: int = None, maxlen: int = None):
+        self._inner_ = _Queue(bound, maxlen)
+        self._closure_cache_ = None
     
     @property
     def closure(self) -> IClosure[In, None]:
-        def call(x): self.put(x)
-        def drop(): self.close()
-        return Closure((call, drop))
+        if self._closure_cache_ is None:
+            # dev-note: the Rust queue's methods are used directly, which saves the `Queue.put`/`Queue.close` wrapper frames.
+            self._closure_cache_ = Closure((self._inner_.put, self._inner_.close))
+        return self._closure_cache_
     
     @property
     def receiver(self) -> 'Queue':
@@ -214,7 +206,10 @@ class Queue(IHandler[In, None, 'Queue'], Generic[In]):
     
     def put(self, value):
         """
-        Puts one element on the queue.
+        Puts one element at the back of the queue.
+
+        If the queue is full, this blocks until room is available when it was created with ``bound``,
+        and discards the oldest queued element to make room (never blocking) when it was created with ``maxlen``.
 
         Raises a ``PyBrokenPipeError`` if the Queue has been closed.
         """
@@ -223,11 +218,12 @@ class Queue(IHandler[In, None, 'Queue'], Generic[In]):
 
     def get(self, timeout: float = None):
         """
-        Gets one element from the queue.
+        Gets the element at the front of the queue, i.e. the oldest one.
 
         Raises a ``StopIteration`` exception if the queue was closed before the timeout ran out,
         this allows using the Queue as an iterator in for-loops.
         Raises a ``TimeoutError`` if the timeout ran out.
+        Raises a ``ValueError`` if the timeout is negative or not a number.
         """
         return self._inner_.get(timeout)
     
@@ -241,8 +237,9 @@ class Queue(IHandler[In, None, 'Queue'], Generic[In]):
 
         Raises a ``TimeoutError`` if the timeout in seconds provided was exceeded before closing,
         whose ``args[0]`` will contain the elements that were collected before timing out.
+        Raises a ``ValueError`` if the timeout is negative or not a number.
         """
-        return self._inner_.get_remaining()
+        return self._inner_.get_remaining(timeout)
 
     def __iter__(self):
         return self